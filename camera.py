@@ -34,7 +34,11 @@ class Camera:
         self.theta = theta  # Horizontal angle
         self.phi = phi  # Vertical angle
 
-        self.target = np.array([0.0, 0.0, 0.0])
+        self.target = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+
+        # Cached camera position, recomputed only after the angles change
+        self._dirty = True
+        self._cam_xyz = (0.0, 0.0, 0.0)
 
         # Mouse control state
         self.prev_x = 0
@@ -77,6 +81,7 @@ class Camera:
 
         # Clamp vertical angle to avoid gimbal lock
         self.phi = max(-85, min(85, self.phi))
+        self._dirty = True
 
         # Remember current mouse position
         self.prev_x = x
@@ -98,22 +103,26 @@ class Camera:
 
         # Clamp distance to reasonable range
         self.distance = max(self.min_distance, min(self.max_distance, self.distance))
+        self._dirty = True
 
     def apply(self):
         """Apply camera transformation to current OpenGL modelview matrix."""
         # Convert spherical coordinates to Cartesian
-        theta_rad = math.radians(self.theta)
-        phi_rad = math.radians(self.phi)
-
-        x = self.distance * math.sin(theta_rad) * math.cos(phi_rad)
-        y = self.distance * math.sin(phi_rad)
-        z = self.distance * math.cos(theta_rad) * math.cos(phi_rad)
+        if self._dirty:
+            theta_rad = math.radians(self.theta)
+            phi_rad = math.radians(self.phi)
+            cos_phi = math.cos(phi_rad)
+
+            self._cam_xyz = (
+                self.distance * math.sin(theta_rad) * cos_phi,
+                self.distance * math.sin(phi_rad),
+                self.distance * math.cos(theta_rad) * cos_phi,
+            )
+            self._dirty = False
 
         # Set camera position and orientation
         glu.gluLookAt(
-            x,
-            y,
-            z,  # Camera position
+            *self._cam_xyz,  # Camera position
             *self.target,  # Target/look-at point
             0.0,
             1.0,
@@ -8,6 +8,7 @@ This application demonstrates a particle system with:
 """
 
 import sys
+import time
 
 import OpenGL.GL as gl
 import OpenGL.GLU as glu
@@ -18,14 +19,10 @@ from plane_attractor import PlaneAttractor
 from camera import Camera
 
 
-def render_text(text, x, y):
+def begin_text_overlay():
     """
-    Renders 2D text overlay on the scene.
-    Uses GLUT bitmap fonts and temporarily switches to orthographic projection.
-
-    Args:
-        text (str): Text to render
-        x, y (int): Screen coordinates for text position
+    Prepare OpenGL state for drawing 2D text over the scene.
+    Disables 3D features and switches to an orthographic projection.
     """
     # Disable 3D features
     gl.glDisable(gl.GL_LIGHTING)
@@ -41,12 +38,9 @@ def render_text(text, x, y):
     gl.glPushMatrix()
     gl.glLoadIdentity()
 
-    # Render text
-    gl.glColor3f(1, 1, 1)
-    gl.glRasterPos2i(x, y)
-    for ch in text:
-        glut.glutBitmapCharacter(glut.GLUT_BITMAP_8_BY_13, ord(ch))
 
+def end_text_overlay():
+    """Restore the OpenGL state changed by begin_text_overlay."""
     # Restore previous state
     gl.glPopMatrix()
     gl.glMatrixMode(gl.GL_PROJECTION)
@@ -58,6 +52,21 @@ def render_text(text, x, y):
     gl.glEnable(gl.GL_DEPTH_TEST)
 
 
+def draw_text(text, x, y):
+    """
+    Draws a line of text using GLUT bitmap fonts.
+    Expects the overlay state set up by begin_text_overlay.
+
+    Args:
+        text (str): Text to render
+        x, y (int): Screen coordinates for text position
+    """
+    gl.glColor3f(1, 1, 1)
+    gl.glRasterPos2i(x, y)
+    for ch in text:
+        glut.glutBitmapCharacter(glut.GLUT_BITMAP_8_BY_13, ord(ch))
+
+
 class ParticleSimulation:
     """Main class for the particle system simulation."""
 
@@ -95,6 +104,17 @@ class ParticleSimulation:
         self.show_attractor = True
         self.attractor_active = True
 
+        # Set whenever the scene changes and needs to be drawn again
+        self._dirty = True
+
+        # Compiled emitter display list and the dimensions it was built for
+        self._emitter_list = None
+        self._emitter_key = None
+
+        # Compiled help text display list and the state it was built for
+        self._help_list = None
+        self._help_key = None
+
     def change_particle_count(self, delta):
         """
         Change the number of particles by the given delta.
@@ -128,11 +148,7 @@ class ParticleSimulation:
         )
 
         # Update trail length in existing particle system
-        self.particle_system.trail_length = self.trail_length
-
-        # Reset trails to apply new length
-        for particle in self.particle_system.particles:
-            particle.reset_trail(self.trail_length)
+        self.particle_system.change_trail_length(self.trail_length)
 
     def init_gl(self):
         """Initialize OpenGL state."""
@@ -167,6 +183,7 @@ class ParticleSimulation:
         # Update particle system with attractor influence if active
         attractor = self.attractor if self.attractor_active else None
         self.particle_system.update(dt, attractor)
+        self._dirty = True
 
     def display(self):
         """Render the scene."""
@@ -193,20 +210,32 @@ class ParticleSimulation:
             self.draw_help_text()
 
         glut.glutSwapBuffers()
+        self._dirty = False
 
     def draw_emitter(self):
         """Draw the cylindrical emitter as wireframe."""
-        gl.glDisable(gl.GL_LIGHTING)
-        gl.glColor3f(0.2, 0.7, 0.2)  # Green wireframe
-        gl.glPushMatrix()
-        glut.glutWireCylinder(
+        # Tessellate the cylinder again only when its dimensions change
+        key = (
             self.particle_system.emitter_radius,
             self.particle_system.emitter_height,
-            20,
-            5,
         )
-        gl.glPopMatrix()
-        gl.glEnable(gl.GL_LIGHTING)
+        if key != self._emitter_key:
+            if self._emitter_list:
+                gl.glDeleteLists(self._emitter_list, 1)
+            self._emitter_list = gl.glGenLists(1)
+
+            gl.glNewList(self._emitter_list, gl.GL_COMPILE)
+            gl.glDisable(gl.GL_LIGHTING)
+            gl.glColor3f(0.2, 0.7, 0.2)  # Green wireframe
+            gl.glPushMatrix()
+            glut.glutWireCylinder(*key, 20, 5)
+            gl.glPopMatrix()
+            gl.glEnable(gl.GL_LIGHTING)
+            gl.glEndList()
+
+            self._emitter_key = key
+
+        gl.glCallList(self._emitter_list)
 
     def draw_help_text(self):
         """Display help text and status information."""
@@ -230,9 +259,30 @@ class ParticleSimulation:
             "Scroll: Zoom in/out",
         ]
 
-        for line in lines:
-            render_text(line, 10, y)
-            y -= 20
+        # Rebuild the display list only when the displayed values change
+        key = (
+            self.particle_count,
+            self.trail_length,
+            self.attractor_active,
+            WINDOW_WIDTH,
+            WINDOW_HEIGHT,
+        )
+        if key != self._help_key:
+            if self._help_list:
+                gl.glDeleteLists(self._help_list, 1)
+            self._help_list = gl.glGenLists(1)
+
+            gl.glNewList(self._help_list, gl.GL_COMPILE)
+            begin_text_overlay()
+            for line in lines:
+                draw_text(line, 10, y)
+                y -= 20
+            end_text_overlay()
+            gl.glEndList()
+
+            self._help_key = key
+
+        gl.glCallList(self._help_list)
 
     def keyboard(self, key, x, y):
         """Handle keyboard input."""
@@ -249,6 +299,7 @@ class ParticleSimulation:
         elif key == b"r":
             self.particle_system.reset()
 
+        self._dirty = True
         glut.glutPostRedisplay()
 
     def special_keys(self, key, x, y):
@@ -266,6 +317,7 @@ class ParticleSimulation:
             # Decrease trail length
             self.change_trail_length(-1)
 
+        self._dirty = True
         glut.glutPostRedisplay()
 
     def mouse(self, button, state, x, y):
@@ -275,11 +327,13 @@ class ParticleSimulation:
     def motion(self, x, y):
         """Handle mouse motion with buttons pressed."""
         self.camera.handle_mouse_motion(x, y)
+        self._dirty = True
         glut.glutPostRedisplay()
 
     def mouse_wheel(self, wheel, direction, x, y):
         """Handle mouse wheel for zoom."""
         self.camera.handle_mouse_wheel(direction)
+        self._dirty = True
         glut.glutPostRedisplay()
 
 
@@ -343,6 +397,11 @@ def idle():
     # Cap dt to avoid large time steps
     dt = min(dt, 0.05)
 
+    # Nothing to redraw while paused and idle, so avoid spinning
+    if simulation.paused and not simulation._dirty:
+        time.sleep(0.01)
+        return
+
     # Update simulation
     simulation.update(dt)
     glut.glutPostRedisplay()
@@ -9,84 +9,146 @@ Implements a particle system with:
 """
 
 import numpy as np
-import random
-import math
 import OpenGL.GL as gl
+from OpenGL.GL import shaders
 
+import particle_kernels
 
-class Particle:
-    """Represents a single particle in the system."""
+# Placeholder plane normal passed to the update kernel without an attractor
+NO_ATTRACTOR_NORMAL = np.zeros(3, dtype=np.float32)
 
-    def __init__(self, position, velocity, size, color, lifetime, max_lifetime):
-        """
-        Initialize a particle with given properties.
+# Draw particles as shader point sprites sized per particle;
+# when disabled, fixed-size smooth points are used instead
+USE_SHADERS = True
 
-        Args:
-            position (np.array): 3D position vector
-            velocity (np.array): 3D velocity vector
-            size (float): Particle size/radius
-            color (list): RGBA color
-            lifetime (float): Current lifetime in seconds
-            max_lifetime (float): Maximum lifetime in seconds
-        """
-        self.position = position.copy()
-        self.velocity = velocity.copy()
-        self.size = size
-        self.color = color.copy()
-        self.lifetime = lifetime
-        self.max_lifetime = max_lifetime
-
-        # Initialize trail as a list of past positions
-        self.trail = [position.copy()]
+# On-screen point size in pixels per unit of particle size
+POINT_SCALE = 80.0
 
-    def update(self, dt, attractor=None):
-        """
-        Update particle state.
+POINT_VERTEX_SHADER = """
+#version 120
+attribute float size;
+uniform float point_scale;
+varying vec4 color;
 
-        Args:
-            dt (float): Time step in seconds
-            attractor: Optional attractor affecting the particle
+void main() {
+    gl_Position = gl_ModelViewProjectionMatrix * gl_Vertex;
+    gl_PointSize = size * point_scale;
+    color = gl_Color;
+}
+"""
 
-        Returns:
-            bool: True if particle is still alive, False if expired
-        """
-        # Apply attractor influence if provided
-        if attractor:
-            attraction_force = attractor.get_force(self.position)
-            self.velocity = self.velocity + attraction_force * dt
+POINT_FRAGMENT_SHADER = """
+#version 120
+varying vec4 color;
+
+void main() {
+    // Cut the square sprite down to a round point
+    vec2 offset = gl_PointCoord - vec2(0.5);
+    if (dot(offset, offset) > 0.25) {
+        discard;
+    }
+    gl_FragColor = color;
+}
+"""
 
-        # Update position based on velocity
-        self.position = self.position + self.velocity * dt
+# Compiled point sprite program with its attribute and uniform locations
+_point_program = None
 
-        # Store position for trail (only keep the most recent positions)
-        self.trail.append(self.position.copy())
 
-        # Update lifetime
-        self.lifetime -= dt
+def get_point_program():
+    """
+    Compile the point sprite shader program on first use.
 
-        # Update alpha based on remaining lifetime proportion
-        life_ratio = self.lifetime / self.max_lifetime
-        self.color[3] = life_ratio  # Alpha channel
+    Returns:
+        tuple: Program handle, size attribute location and
+            point scale uniform location
+    """
+    global _point_program
+    if _point_program is None:
+        program = shaders.compileProgram(
+            shaders.compileShader(POINT_VERTEX_SHADER, gl.GL_VERTEX_SHADER),
+            shaders.compileShader(POINT_FRAGMENT_SHADER, gl.GL_FRAGMENT_SHADER),
+        )
+        _point_program = (
+            program,
+            gl.glGetAttribLocation(program, "size"),
+            gl.glGetUniformLocation(program, "point_scale"),
+        )
+    return _point_program
 
-        # Return True if particle is still alive
-        return self.lifetime > 0
 
-    def reset_trail(self, max_length):
+class Particle:
+    """
+    Lightweight view of a single particle stored in a ParticleSystem.
+
+    Particle data lives in the system's per-field arrays; this class only
+    keeps an index into them, so attribute access reads and writes the
+    shared storage directly.
+    """
+
+    def __init__(self, system, index):
         """
-        Reset trail to only contain current position.
+        Initialize a view of a particle.
 
         Args:
-            max_length (int): Maximum trail length to keep
+            system (ParticleSystem): System owning the particle data
+            index (int): Row of the particle in the system arrays
         """
-        if len(self.trail) > max_length:
-            self.trail = self.trail[-max_length:]
+        self._system = system
+        self._index = index
+
+    @property
+    def position(self):
+        """np.array: 3D position vector"""
+        return self._system.pos[self._index]
+
+    @property
+    def velocity(self):
+        """np.array: 3D velocity vector"""
+        return self._system.vel[self._index]
+
+    @property
+    def size(self):
+        """float: Particle size/radius"""
+        return self._system.sizes[self._index]
+
+    @property
+    def color(self):
+        """np.array: RGBA color, 8 bits per channel"""
+        return self._system.color_u8[self._index]
+
+    @property
+    def lifetime(self):
+        """float: Current lifetime in seconds"""
+        return self._system.lifetimes[self._index]
+
+    @property
+    def max_lifetime(self):
+        """float: Maximum lifetime in seconds"""
+        return self._system.max_lifetimes[self._index]
+
+    @property
+    def trail(self):
+        """np.array: Recent positions, oldest first"""
+        return self._system.trail[self._index, self._system.trail_order()]
 
 
 class ParticleSystem:
-    """Manages a system of particles emitted from a cylindrical surface."""
+    """
+    Manages a system of particles emitted from a cylindrical surface.
+
+    Particle properties are stored as one array per field (positions,
+    velocities, colors, ...), so the whole system is updated with a few
+    vectorized operations per frame instead of a Python loop per particle.
+    """
 
     def __init__(
-        self, count=200, trail_length=4, emitter_radius=1.0, emitter_height=2.0
+        self,
+        count=200,
+        trail_length=4,
+        emitter_radius=1.0,
+        emitter_height=2.0,
+        seed=None,
     ):
         """
         Initialize the particle system.
@@ -96,6 +158,7 @@ class ParticleSystem:
             trail_length (int): Length of particle trails
             emitter_radius (float): Radius of cylindrical emitter
             emitter_height (float): Height of cylindrical emitter
+            seed (int): Optional seed for reproducible emission
         """
         self.count = count
         self.trail_length = trail_length
@@ -110,61 +173,121 @@ class ParticleSystem:
         self.min_lifetime = 3.0
         self.max_lifetime = 8.0
 
+        # Particle storage, one row per particle
+        self.pos = np.empty((count, 3), dtype=np.float32)
+        self.vel = np.empty((count, 3), dtype=np.float32)
+        self.color_u8 = np.empty((count, 4), dtype=np.uint8)
+        self.lifetimes = np.empty(count, dtype=np.float32)
+        self.max_lifetimes = np.empty(count, dtype=np.float32)
+        self.sizes = np.empty(count, dtype=np.float32)
+
+        # Expired particle flags written by the update kernel
+        self.dead = np.zeros(count, dtype=bool)
+
+        # Random number generator used for emission
+        self.rng = np.random.default_rng(seed)
+
+        # Ring buffer of recent positions; trail_head is the next slot to write
+        self.trail = np.empty((count, trail_length, 3), dtype=np.float32)
+        self.trail_head = 0
+        self.update_alpha_ramp()
+
         # Create initial particles
-        self.particles = []
         self.reset()
 
+    @property
+    def particles(self):
+        """list: Views of all particles in the system."""
+        return [Particle(self, i) for i in range(self.count)]
+
     def reset(self):
         """Reset and recreate all particles."""
-        self.particles = []
+        self.respawn(np.ones(self.count, dtype=bool))
 
-        for _ in range(self.count):
-            # Create a new particle with random properties
-            self.particles.append(self.create_particle())
-
-    def create_particle(self):
+    def respawn(self, mask):
         """
-        Create a new particle at a random position on the cylinder surface.
+        Re-initialize the selected particles with new random properties.
 
-        Returns:
-            Particle: A new particle instance
+        Args:
+            mask (np.array): Boolean mask of particles to recreate
         """
-        # Random angle around cylinder
-        angle = random.uniform(0, 2 * math.pi)
-
-        # Random height along cylinder
-        height = random.uniform(-self.emitter_height / 2, self.emitter_height / 2)
+        # Resolve the mask once and reuse the indices for every field
+        index = np.flatnonzero(mask)
+        if not index.size:
+            return
 
-        # Position on cylinder surface
-        x = self.emitter_radius * math.cos(angle)
-        y = height
-        z = self.emitter_radius * math.sin(angle)
-        position = np.array([x, y, z])
+        new = self.create_particles(index.size)
 
-        # Calculate normal at cylinder surface (points outward from center)
-        normal = np.array([math.cos(angle), 0, math.sin(angle)])
+        self.pos[index] = new["pos"]
+        self.vel[index] = new["vel"]
+        self.color_u8[index] = new["color"]
+        self.sizes[index] = new["size"]
+        self.lifetimes[index] = new["max_lifetime"]
+        self.max_lifetimes[index] = new["max_lifetime"]
 
-        # Random speed
-        speed = random.uniform(self.min_speed, self.max_speed)
+        # Collapse the trails onto the spawn points
+        self.trail[index] = self.pos[index, None, :]
 
-        # Velocity based on normal direction
-        velocity = normal * speed
+    def create_particles(self, n):
+        """
+        Create new particles at random positions on the cylinder surface.
 
-        # Random size
-        size = random.uniform(self.min_size, self.max_size)
+        Args:
+            n (int): Number of particles to create
 
-        # Random color with full alpha
-        color = [
-            random.uniform(0.3, 1.0),  # R
-            random.uniform(0.3, 1.0),  # G
-            random.uniform(0.3, 1.0),  # B
-            1.0,  # A (starts fully opaque)
-        ]
+        Returns:
+            dict: Arrays of particle properties keyed by field name
+        """
+        # Random angles around cylinder
+        angle = self.uniform(0, 2 * np.pi, n)
+        cos_a = np.cos(angle)
+        sin_a = np.sin(angle)
+
+        # Random heights along cylinder
+        half_height = self.emitter_height / 2
+        height = self.uniform(-half_height, half_height, n)
+
+        # Positions on cylinder surface
+        pos = np.stack(
+            [self.emitter_radius * cos_a, height, self.emitter_radius * sin_a], axis=1
+        )
+
+        # Calculate normals at cylinder surface (point outward from center)
+        normal = np.stack([cos_a, np.zeros_like(cos_a), sin_a], axis=1)
+
+        # Velocities based on normal direction with random speed
+        speed = self.uniform(self.min_speed, self.max_speed, (n, 1))
+        vel = normal * speed
+
+        # Random colors (0.3..1.0 per channel) with full alpha
+        color = np.empty((n, 4), dtype=np.uint8)
+        color[:, :3] = self.rng.integers(76, 256, (n, 3), dtype=np.uint8)
+        color[:, 3] = 255
+
+        return {
+            "pos": pos,
+            "vel": vel,
+            "color": color,
+            "size": self.uniform(self.min_size, self.max_size, n),
+            "max_lifetime": self.uniform(self.min_lifetime, self.max_lifetime, n),
+        }
+
+    def uniform(self, low, high, size):
+        """
+        Draw float32 samples uniformly distributed in [low, high).
 
-        # Random lifetime
-        max_lifetime = random.uniform(self.min_lifetime, self.max_lifetime)
+        Args:
+            low (float): Lower bound
+            high (float): Upper bound
+            size (int or tuple): Output shape
 
-        return Particle(position, velocity, size, color, max_lifetime, max_lifetime)
+        Returns:
+            np.array: Random float32 samples
+        """
+        samples = self.rng.random(size, dtype=np.float32)
+        samples *= high - low
+        samples += low
+        return samples
 
     def update(self, dt, attractor=None):
         """
@@ -174,55 +297,153 @@ class ParticleSystem:
             dt (float): Time step in seconds
             attractor: Optional attractor affecting particles
         """
-        # Temporary list for alive particles
-        alive_particles = []
+        # Keep the whole step in single precision
+        dt = np.float32(dt)
 
-        for particle in self.particles:
-            # Update the particle
-            if particle.update(dt, attractor):
-                # Keep alive particles
-                particle.reset_trail(self.trail_length)
-                alive_particles.append(particle)
-            else:
-                # Replace dead particles with new ones
-                alive_particles.append(self.create_particle())
+        # Select the plane parameters; without an attractor the force is skipped
+        if attractor:
+            nrm = attractor.normal
+            D = attractor.D
+            strength = np.float32(attractor.strength)
+            inv_range = attractor.inv_range
+            has_attractor = True
+        else:
+            nrm = NO_ATTRACTOR_NORMAL
+            D = np.float32(0.0)
+            strength = np.float32(0.0)
+            inv_range = np.float32(1.0)
+            has_attractor = False
+
+        # Apply attractor influence, move and age all particles in one pass
+        particle_kernels.step(
+            self.pos,
+            self.vel,
+            self.color_u8,
+            self.lifetimes,
+            self.max_lifetimes,
+            nrm,
+            D,
+            strength,
+            inv_range,
+            dt,
+            has_attractor,
+            self.dead,
+        )
+
+        # Store the new positions over the oldest trail entries
+        self.trail[:, self.trail_head] = self.pos
+        self.trail_head = (self.trail_head + 1) % self.trail_length
+
+        # Replace dead particles with new ones in place
+        self.respawn(self.dead)
+
+    def change_trail_length(self, trail_length):
+        """
+        Change the number of positions kept in particle trails.
+
+        Args:
+            trail_length (int): New trail length
+        """
+        # Keep the most recent positions, padding with the oldest one
+        ordered = self.trail[:, self.trail_order()]
+        keep = min(trail_length, self.trail_length)
+        trail = np.empty((self.count, trail_length, 3), dtype=np.float32)
+        trail[:, trail_length - keep :] = ordered[:, self.trail_length - keep :]
+        trail[:, : trail_length - keep] = trail[:, trail_length - keep, None]
+
+        self.trail = trail
+        self.trail_head = 0
+        self.trail_length = trail_length
+        self.update_alpha_ramp()
 
-        self.particles = alive_particles
+    def update_alpha_ramp(self):
+        """Precompute the alpha multiplier of each trail segment, oldest first."""
+        segments = np.arange(self.trail_length - 1, dtype=np.float32)
+        self._alpha_ramp = 1.0 - segments / self.trail_length
+
+    def trail_order(self):
+        """
+        Get ring buffer slots of the trail positions from oldest to newest.
+
+        Returns:
+            np.array: Indices into the trail axis of the ring buffer
+        """
+        return (self.trail_head + np.arange(self.trail_length)) % self.trail_length
+
+    def trail_vertices(self):
+        """
+        Build line segment endpoints and colors for all particle trails.
+
+        Returns:
+            tuple: (M, 3) vertex positions and (M, 4) RGBA colors, where
+                consecutive vertex pairs form one trail segment
+        """
+        segments = self.trail_length - 1
+        order = self.trail_order()
+
+        # Segment endpoints: each trail position paired with the next one
+        lines = np.empty((self.count, segments, 2, 3), dtype=np.float32)
+        lines[:, :, 0] = self.trail[:, order[:-1]]
+        lines[:, :, 1] = self.trail[:, order[1:]]
+
+        # Particle color with decreasing alpha for trail segments
+        colors = np.empty((self.count, segments, 2, 4), dtype=np.uint8)
+        colors[..., :3] = self.color_u8[:, None, None, :3]
+        colors[..., 3] = (self.color_u8[:, 3, None] * self._alpha_ramp)[:, :, None]
+
+        return lines.reshape(-1, 3), colors.reshape(-1, 4)
 
     def draw(self):
         """Draw all particles and their trails."""
         # Disable lighting for particles
         gl.glDisable(gl.GL_LIGHTING)
 
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+
         # Draw trails first (lines)
-        gl.glBegin(gl.GL_LINES)
-        for particle in self.particles:
-            if len(particle.trail) > 1:
-                # Use particle color with decreasing alpha for trail segments
-                trail_alpha_step = particle.color[3] / len(particle.trail)
-
-                for i in range(len(particle.trail) - 1):
-                    # Calculate alpha for this segment
-                    alpha = particle.color[3] - (i * trail_alpha_step)
-
-                    # Set color with calculated alpha
-                    gl.glColor4f(
-                        particle.color[0], particle.color[1], particle.color[2], alpha
-                    )
-
-                    # Draw line segment
-                    gl.glVertex3f(*particle.trail[i])
-                    gl.glVertex3f(*particle.trail[i + 1])
-        gl.glEnd()
+        if self.trail_length > 1:
+            lines, colors = self.trail_vertices()
+            gl.glVertexPointer(3, gl.GL_FLOAT, 0, lines)
+            gl.glColorPointer(4, gl.GL_UNSIGNED_BYTE, 0, colors)
+            gl.glDrawArrays(gl.GL_LINES, 0, len(lines))
 
         # Draw particles as points
-        gl.glEnable(gl.GL_POINT_SMOOTH)
-        gl.glPointSize(8.0)
-        gl.glBegin(gl.GL_POINTS)
-        for particle in self.particles:
-            gl.glColor4f(*particle.color)
-            gl.glVertex3f(*particle.position)
-        gl.glEnd()
+        gl.glVertexPointer(3, gl.GL_FLOAT, 0, self.pos)
+        gl.glColorPointer(4, gl.GL_UNSIGNED_BYTE, 0, self.color_u8)
+        if USE_SHADERS:
+            self.draw_point_sprites()
+        else:
+            gl.glEnable(gl.GL_POINT_SMOOTH)
+            gl.glPointSize(8.0)
+            gl.glDrawArrays(gl.GL_POINTS, 0, self.count)
+
+        gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
 
         # Re-enable lighting
         gl.glEnable(gl.GL_LIGHTING)
+
+    def draw_point_sprites(self):
+        """
+        Draw particles as round sprites scaled by their individual sizes.
+        Expects position and color arrays to be bound already.
+        """
+        program, size_location, scale_location = get_point_program()
+
+        gl.glUseProgram(program)
+        gl.glUniform1f(scale_location, POINT_SCALE)
+        gl.glEnable(gl.GL_VERTEX_PROGRAM_POINT_SIZE)
+        gl.glEnable(gl.GL_POINT_SPRITE)
+
+        # Per-particle sizes as a generic vertex attribute
+        gl.glEnableVertexAttribArray(size_location)
+        gl.glVertexAttribPointer(
+            size_location, 1, gl.GL_FLOAT, gl.GL_FALSE, 0, self.sizes
+        )
+        gl.glDrawArrays(gl.GL_POINTS, 0, self.count)
+        gl.glDisableVertexAttribArray(size_location)
+
+        gl.glDisable(gl.GL_POINT_SPRITE)
+        gl.glDisable(gl.GL_VERTEX_PROGRAM_POINT_SIZE)
+        gl.glUseProgram(0)
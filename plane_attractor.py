@@ -4,10 +4,26 @@ Plane Attractor implementation for particle systems.
 Implements a plane that attracts particles when they enter its range.
 """
 
+import math
+
 import numpy as np
 import OpenGL.GL as gl
 
 
+def _normalize3(v):
+    """
+    Scale a 3D vector to unit length.
+
+    Args:
+        v (np.array): 3D vector
+
+    Returns:
+        np.array: Unit vector with the same direction
+    """
+    inv = 1.0 / math.sqrt(float(v[0] * v[0] + v[1] * v[1] + v[2] * v[2]))
+    return v * np.float32(inv)
+
+
 class PlaneAttractor:
     """
     Represents a plane that attracts particles.
@@ -30,10 +46,11 @@ class PlaneAttractor:
 
         # Normalize the normal vector
         normal_array = np.array(normal, dtype=np.float32)
-        self.normal = normal_array / np.linalg.norm(normal_array)
+        self.normal = _normalize3(normal_array)
 
         self.strength = strength
         self.range = range
+        self.inv_range = np.float32(1.0 / range)
 
         # Calculate plane equation coefficients (Ax + By + Cz + D = 0)
         self.A = self.normal[0]
@@ -41,6 +58,35 @@ class PlaneAttractor:
         self.C = self.normal[2]
         self.D = -np.dot(self.normal, self.position)
 
+        # Calculate plane corners for visualization
+        # First find two vectors perpendicular to the normal
+        v1 = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        if abs(np.dot(v1, self.normal)) > 0.9:
+            v1 = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        v1 = v1 - np.dot(v1, self.normal) * self.normal
+        v1 = _normalize3(v1)
+
+        v2 = np.cross(self.normal, v1)
+        v2 = _normalize3(v2)
+
+        # Scale vectors to create a visible plane
+        scale = 10.0
+        v1 *= scale
+        v2 *= scale
+
+        self.corners = np.array(
+            [
+                self.position + v1 + v2,
+                self.position + v1 - v2,
+                self.position - v1 - v2,
+                self.position - v1 + v2,
+            ],
+            dtype=np.float32,
+        )
+
+        # Display list with the plane geometry, compiled on first draw
+        self._display_list = None
+
     def get_force(self, position):
         """
         Calculate the force applied to a particle at the given position.
@@ -51,49 +97,51 @@ class PlaneAttractor:
         Returns:
             np.array: 3D force vector
         """
-        # Calculate signed distance from point to plane
-        point = np.array(position)
-        distance = self.A * point[0] + self.B * point[1] + self.C * point[2] + self.D
+        point = np.asarray(position, dtype=np.float32).reshape(1, 3)
+        return self.get_force_batch(point)[0]
+
+    def get_force_batch(self, positions):
+        """
+        Calculate the forces applied to particles at the given positions.
+
+        Kept as public API for callers outside the particle system.
+        ParticleSystem.update does not call it; the same force is computed
+        inline by particle_kernels.step (both the Numba kernel and its NumPy
+        fallback), so changes to the force model must be made in all three.
+
+        Args:
+            positions (np.array): (N, 3) array of particle positions
 
-        # If outside of range, no force is applied
-        if abs(distance) > self.range:
-            return np.zeros(3)
+        Returns:
+            np.array: (N, 3) array of force vectors
+        """
+        # Calculate signed distances from points to plane
+        distance = positions @ self.normal + self.D
 
         # Force is stronger as the particle gets closer to the plane
-        # but within the range (inverse proportion to distance)
-        force_magnitude = self.strength * (1.0 - abs(distance) / self.range)
+        # and drops to zero outside of range
+        magnitude = self.strength * np.maximum(
+            0.0, 1.0 - np.abs(distance) * self.inv_range
+        )
 
         # Force direction is towards the plane (opposite of normal if above plane)
-        force_direction = -np.sign(distance) * self.normal
+        scale = (-np.sign(distance) * magnitude).astype(np.float32)
 
-        return force_magnitude * force_direction
+        return scale[:, None] * self.normal[None, :]
 
     def draw(self):
         """Draw a representation of the plane attractor."""
-        # Calculate plane corners for visualization
-        # First find two vectors perpendicular to the normal
-        v1 = np.array([1.0, 0.0, 0.0])
-        if abs(np.dot(v1, self.normal)) > 0.9:
-            v1 = np.array([0.0, 1.0, 0.0])
-        v1 = v1 - np.dot(v1, self.normal) * self.normal
-        v1 = v1 / np.linalg.norm(v1)
-
-        v2 = np.cross(self.normal, v1)
-        v2 = v2 / np.linalg.norm(v2)
-
-        # Scale vectors to create a visible plane
-        scale = 10.0
-        v1 *= scale
-        v2 *= scale
+        # Geometry is static, so record the drawing commands once
+        if self._display_list is None:
+            self._display_list = gl.glGenLists(1)
+            gl.glNewList(self._display_list, gl.GL_COMPILE)
+            self.draw_geometry()
+            gl.glEndList()
 
-        # Calculate corners
-        corners = [
-            self.position + v1 + v2,
-            self.position + v1 - v2,
-            self.position - v1 - v2,
-            self.position - v1 + v2,
-        ]
+        gl.glCallList(self._display_list)
 
+    def draw_geometry(self):
+        """Issue the OpenGL commands drawing the plane and its normal."""
         # Draw plane with semi-transparency
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
@@ -107,7 +155,7 @@ class PlaneAttractor:
         # Draw plane as a quad
         gl.glBegin(gl.GL_QUADS)
         gl.glNormal3f(*self.normal)
-        for corner in corners:
+        for corner in self.corners:
             gl.glVertex3f(*corner)
         gl.glEnd()
 